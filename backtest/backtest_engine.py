@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import time
 from collections import defaultdict
+from collections.abc import Callable
 from datetime import UTC, datetime
+from itertools import product
 from typing import Any
 
 from structlog.stdlib import BoundLogger
@@ -23,7 +25,7 @@ from core.event_bus import EventBus
 from core.event_types import EventType
 from core.events import BarCloseEvent, BaseEvent, SignalEvent, TickEvent
 from data.asset_types import AssetClass
-from data.models import Tick
+from data.models import OHLCVBar, Tick
 from execution.order_manager import OrderManager
 from execution.order_models import PositionStatus
 from indicators.indicator_engine import IndicatorEngine
@@ -69,6 +71,15 @@ class BacktestEngine:
         self._peak_equity = config.initial_capital
         self._symbol_context: tuple[str, str, str] | None = None
 
+    def preload_bars(self, bars: list[OHLCVBar]) -> None:
+        """Share bars fetched once by the caller instead of querying the repository per engine."""
+
+        grouped: dict[tuple[str, str, str], list[OHLCVBar]] = defaultdict(list)
+        for bar in bars:
+            grouped[(bar.symbol, bar.broker, bar.timeframe)].append(bar)
+        for (symbol, broker, timeframe), series in grouped.items():
+            self._windowed_repository.seed_series(symbol, broker, timeframe, series)
+
     async def run(self) -> BacktestResult:
         """Execute configured mode and return normalized result."""
 
@@ -80,7 +91,7 @@ class BacktestEngine:
             return await self._run_out_of_sample()
         raise ValueError(f"Unsupported mode: {self.config.mode}")
 
-    async def _run_simple(self) -> BacktestResult:
+    async def _run_simple(self, on_progress: Callable[[int, float], bool] | None = None) -> BacktestResult:
         started_at = time.perf_counter()
         self._reset_state(self.config.initial_capital)
         await self._attach_runtime_handlers()
@@ -91,21 +102,30 @@ class BacktestEngine:
             run_id=self.config.run_id,
         )
 
+        steps = 0
+        stopped_early = False
         try:
-            for symbol in self.config.symbols:
-                for broker in self.config.brokers:
-                    for timeframe in self.config.timeframes:
-                        self._symbol_context = (symbol, broker, timeframe)
-                        async for _event in injector.inject_bars(
-                            symbol=symbol,
-                            broker=broker,
-                            timeframe=timeframe,
-                            start=self.config.start_date,
-                            end=self.config.end_date,
-                            warmup_bars=self.config.warmup_bars,
-                        ):
-                            await self._drain_bus()
-                            self._record_equity_point()
+            for symbol, broker, timeframe in product(self.config.symbols, self.config.brokers, self.config.timeframes):
+                if stopped_early:
+                    break
+                self._symbol_context = (symbol, broker, timeframe)
+                async for _event in injector.inject_bars(
+                    symbol=symbol,
+                    broker=broker,
+                    timeframe=timeframe,
+                    start=self.config.start_date,
+                    end=self.config.end_date,
+                    warmup_bars=self.config.warmup_bars,
+                ):
+                    await self._drain_bus()
+                    self._record_equity_point()
+                    if on_progress is None:
+                        continue
+                    steps += 1
+                    running_return = self._equity_curve[-1][1] / self.config.initial_capital - 1.0
+                    if on_progress(steps, running_return):
+                        stopped_early = True
+                        injector.stop()
             await self._drain_bus()
             await self._close_open_positions()
             await self._drain_bus()
@@ -186,8 +206,13 @@ class BacktestEngine:
         params: dict[str, Any],
         start: datetime,
         end: datetime,
+        on_progress: Callable[[int, float], bool] | None = None,
     ) -> BacktestMetrics:
-        """Lightweight run for optimizers."""
+        """Lightweight run for optimizers.
+
+        ``on_progress(step, running_return)`` is called after every injected bar; returning True
+        stops the run early and the metrics then cover only the bars seen so far.
+        """
 
         original = self.config
         cfg = original.model_copy(
@@ -201,7 +226,7 @@ class BacktestEngine:
         )
         self.config = cfg
         try:
-            result = await self._run_simple()
+            result = await self._run_simple(on_progress)
             if params:
                 # Apply deterministic mild penalty for larger parameter sets.
                 penalty = 0.001 * len(params)
@@ -4,15 +4,20 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+from bisect import bisect_left, bisect_right
 from collections.abc import AsyncGenerator, Callable
 from datetime import UTC, datetime
-from typing import Any
+from operator import attrgetter
+from typing import Any, cast
 
 from core.event_bus import EventBus
 from core.events import BarCloseEvent, TickEvent
+from data.bar_series import BarSeries
 from data.models import OHLCVBar, Tick
 from storage.data_repository import DataRepository
 
+_CLOSE_TIME = attrgetter("timestamp_close")
+
 
 class WindowedDataRepository:
     """Data facade exposing only bars up to a moving visible timestamp."""
@@ -20,6 +25,7 @@ class WindowedDataRepository:
     def __init__(self, base_repository: DataRepository) -> None:
         self._base = base_repository
         self._series: dict[tuple[str, str, str], list[OHLCVBar]] = {}
+        self._columns: dict[tuple[str, str, str], BarSeries] = {}
         self._visible_until: dict[tuple[str, str, str], datetime | None] = {}
 
     async def preload_series(
@@ -42,10 +48,14 @@ class WindowedDataRepository:
                 end=end,
                 auto_fetch=True,
             )
-            self._series[key] = sorted(bars, key=lambda item: item.timestamp_close)
-            self._visible_until[key] = None
+            self._install(key, bars)
         return self._series[key]
 
+    def seed_series(self, symbol: str, broker: str, timeframe: str, bars: list[OHLCVBar]) -> None:
+        """Install already-loaded bars so later preloads skip the base repository."""
+
+        self._install((symbol, broker, timeframe), bars)
+
     def set_visible_until(self, symbol: str, broker: str, timeframe: str, timestamp: datetime) -> None:
         """Update visibility limit for a series."""
 
@@ -63,23 +73,37 @@ class WindowedDataRepository:
     ) -> list[OHLCVBar]:
         """Return only bars up to visible timestamp to avoid look-ahead bias."""
 
+        series = await self.get_series(symbol, broker, timeframe, start, end, auto_fetch)
+        return cast(list[OHLCVBar], series.bars)
+
+    async def get_series(
+        self,
+        symbol: str,
+        broker: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+        auto_fetch: bool = True,
+    ) -> BarSeries:
+        """Column view of the bars ``get_ohlcv`` returns.
+
+        The view's columns are slices of the preloaded history's, so analysing successive windows
+        does not re-read every bar.
+        """
+
         key = (symbol, broker, timeframe)
         if key not in self._series:
             if not auto_fetch:
-                return []
+                return BarSeries([])
             await self.preload_series(symbol, broker, timeframe, start, end)
         visible_until = self._visible_until.get(key)
         bars = self._series.get(key, [])
-        filtered: list[OHLCVBar] = []
-        start_utc = start.astimezone(UTC)
         end_utc = end.astimezone(UTC)
-        for bar in bars:
-            if bar.timestamp_close < start_utc or bar.timestamp_close > end_utc:
-                continue
-            if visible_until is not None and bar.timestamp_close > visible_until:
-                continue
-            filtered.append(bar)
-        return filtered
+        if visible_until is not None and visible_until < end_utc:
+            end_utc = visible_until
+        lo = bisect_left(bars, start.astimezone(UTC), key=_CLOSE_TIME)
+        hi = bisect_right(bars, end_utc, lo=lo, key=_CLOSE_TIME)
+        return self._columns[key].window(lo, hi)
 
     def visible_count(self, symbol: str, broker: str, timeframe: str) -> int:
         """Return currently visible bars count for diagnostics/tests."""
@@ -89,7 +113,13 @@ class WindowedDataRepository:
         visible_until = self._visible_until.get(key)
         if visible_until is None:
             return 0
-        return sum(1 for bar in bars if bar.timestamp_close <= visible_until)
+        return bisect_right(bars, visible_until, key=_CLOSE_TIME)
+
+    def _install(self, key: tuple[str, str, str], bars: list[OHLCVBar]) -> None:
+        series = sorted(bars, key=_CLOSE_TIME)
+        self._series[key] = series
+        self._columns[key] = BarSeries(series)
+        self._visible_until[key] = None
 
 
 class DataInjector:
@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
 import math
+import multiprocessing
+import os
 import random
+import tempfile
 import time
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import product
+from multiprocessing.util import Finalize
+from pathlib import Path
 from typing import Any
 
 from structlog.stdlib import BoundLogger
 
 from backtest.backtest_engine import BacktestEngine
 from backtest.backtest_models import BacktestConfig, BacktestMetrics, OptimizationResult
+from backtest.runtime import build_backtest_runtime
+from core.event_bus import EventBus
+from core.logger import get_logger
+from storage.parquet_store import ParquetStore
 
 
 @dataclass(slots=True)
@@ -22,11 +35,136 @@ class _TrialRecord:
     metrics: BacktestMetrics
 
 
+@dataclass(slots=True)
+class _SigmaPruner:
+    """Stop trials whose running return falls below best - k*sigma of finished trials at the same step."""
+
+    k: float
+    interval: int = 25
+    min_trials: int = 5
+    curves: list[dict[int, float]] = field(default_factory=list)
+
+    def should_prune(self, step: int, value: float) -> bool:
+        if step % self.interval or len(self.curves) < self.min_trials:
+            return False
+        peers = [curve[step] for curve in self.curves if step in curve]
+        if len(peers) < self.min_trials:
+            return False
+        mean = sum(peers) / len(peers)
+        sigma = math.sqrt(sum((item - mean) ** 2 for item in peers) / len(peers))
+        return sigma > 0.0 and value < max(peers) - self.k * sigma
+
+
+@dataclass(slots=True)
+class _TrialProgress:
+    """Running-return curve sampled at the pruner's interval, and whether the trial was pruned."""
+
+    curve: dict[int, float] = field(default_factory=dict)
+    pruned: bool = False
+
+
+def _progress_callback(pruner: _SigmaPruner, progress: _TrialProgress) -> Callable[[int, float], bool]:
+    def _on_progress(step: int, value: float) -> bool:
+        if step % pruner.interval == 0:
+            progress.curve[step] = value
+        progress.pruned = pruner.should_prune(step, value)
+        return progress.pruned
+
+    return _on_progress
+
+
+_TrialRunner = Callable[[dict[str, float], Callable[[int, float], bool] | None], Awaitable[BacktestMetrics]]
+
+
+# Worker-process state, set up once by the pool initializer and reused across trials.
+_PROCESS_LOOP: asyncio.AbstractEventLoop | None = None
+_PROCESS_ENGINE: BacktestEngine | None = None
+
+
+def _init_trial_process(config: BacktestConfig, shared_path: str, scratch_path: str) -> None:
+    """Process-pool initializer: build this process's engine and register its teardown."""
+
+    global _PROCESS_LOOP, _PROCESS_ENGINE
+    _PROCESS_LOOP = asyncio.new_event_loop()
+    event_bus, _PROCESS_ENGINE = _PROCESS_LOOP.run_until_complete(
+        _build_process_engine(config, Path(shared_path), Path(scratch_path) / f"process_{os.getpid()}")
+    )
+    # Pool workers leave through os._exit, which skips atexit; finalizers still run on a clean shutdown.
+    Finalize(None, _close_process_runtime, args=(_PROCESS_LOOP, event_bus), exitpriority=10)
+
+
+def _close_process_runtime(loop: asyncio.AbstractEventLoop, event_bus: EventBus) -> None:
+    loop.run_until_complete(event_bus.stop())
+    loop.close()
+
+
+def _run_trial_in_process(strategy_id: str, params: dict[str, float]) -> BacktestMetrics:
+    """Process-pool entry point: run one trial on the engine built by the initializer."""
+
+    if _PROCESS_LOOP is None or _PROCESS_ENGINE is None:
+        raise RuntimeError("Trial process was started without _init_trial_process")
+    config = _PROCESS_ENGINE.config
+    return _PROCESS_LOOP.run_until_complete(
+        _PROCESS_ENGINE.run_single_strategy(
+            strategy_id=strategy_id,
+            params=params,
+            start=config.start_date,
+            end=config.end_date,
+        )
+    )
+
+
+async def _build_process_engine(
+    config: BacktestConfig,
+    shared_path: Path,
+    data_store_path: Path,
+) -> tuple[EventBus, BacktestEngine]:
+    (
+        event_bus,
+        repository,
+        indicator_engine,
+        regime_detector,
+        signal_engine,
+        risk_manager,
+        order_manager,
+    ) = await build_backtest_runtime(
+        run_id=config.run_id,
+        data_store_path=data_store_path,
+        include_signal_reasons=False,
+    )
+    engine = BacktestEngine(
+        config=config,
+        data_repository=repository,
+        signal_engine=signal_engine,
+        risk_manager=risk_manager,
+        indicator_engine=indicator_engine,
+        regime_detector=regime_detector,
+        event_bus=event_bus,
+        order_manager=order_manager,
+        logger=get_logger("backtest.engine"),
+    )
+    # Bars come from the shared parquet store the parent already populated.
+    shared_store = ParquetStore(base_path=shared_path)
+    for symbol, broker, timeframe in product(config.symbols, config.brokers, config.timeframes):
+        bars = await shared_store.load_bars(symbol, broker, timeframe, config.start_date, config.end_date)
+        await repository.save_ohlcv(bars)
+        engine.preload_bars(bars)
+    return event_bus, engine
+
+
 class StrategyOptimizer:
     """Optimize strategy parameters with anti-overfit penalties."""
 
-    def __init__(self, engine: BacktestEngine, config: BacktestConfig, logger: BoundLogger) -> None:
+    def __init__(
+        self,
+        engine: BacktestEngine,
+        config: BacktestConfig,
+        logger: BoundLogger,
+        process_data_store: Path | None = None,
+    ) -> None:
         self._engine = engine
+        # Parquet store holding the config's bars; worker processes load them from here.
+        self._process_data_store = process_data_store
         self._config = config
         self._logger = logger.bind(module="backtest.optimizer")
 
@@ -38,44 +176,82 @@ class StrategyOptimizer:
         metric: str = "sharpe_ratio",
         direction: str = "maximize",
         n_jobs: int = 1,
+        prune_sigma: float | None = None,
     ) -> OptimizationResult:
-        """Run optimization and return ranked result."""
+        """Run optimization and return ranked result.
+
+        With ``n_jobs`` > 1 and a ``process_data_store``, trials run in ``n_jobs`` spawned processes,
+        each with its own runtime; otherwise every trial runs in turn on ``engine``, since trials sharing
+        one event loop would only interleave. Each process pays for spawning, importing and building a
+        runtime before its first trial, so processes only pay off once trials are long (months of
+        intraday bars) or numerous; short runs are faster serially.
+        With ``prune_sigma`` set, in-process trials whose running return drops below the best finished
+        trial minus ``prune_sigma`` standard deviations are stopped early and left out of the result.
+        """
 
-        _ = n_jobs
         started = time.perf_counter()
         rng = random.Random(42)
-        trials: list[_TrialRecord] = []
-        best: _TrialRecord | None = None
 
         if n_trials <= 0:
             n_trials = 1
 
+        # Sample every trial up front so results do not depend on how trials are spread over workers.
+        sampled = [self._sample_params(param_space, rng) for _ in range(n_trials)]
+        records: list[_TrialRecord | None] = [None] * n_trials
+        pruner = _SigmaPruner(k=prune_sigma) if prune_sigma is not None else None
+        queue: asyncio.Queue[int] = asyncio.Queue()
         for trial_idx in range(n_trials):
-            params = self._sample_params(param_space, rng)
-            metrics = await self._engine.run_single_strategy(
-                strategy_id=strategy_id,
-                params=params,
-                start=self._config.start_date,
-                end=self._config.end_date,
-            )
-            raw = float(getattr(metrics, metric, 0.0))
-            score = self._penalty_score(metrics, params)
-            if direction.lower() == "minimize":
-                score = -score
-            trial = _TrialRecord(params=params, raw_metric=raw, score=score, metrics=metrics)
-            trials.append(trial)
-            if best is None:
+            queue.put_nowait(trial_idx)
+
+        async def _worker(run_trial: _TrialRunner) -> None:
+            # Each runner owns its runtime state, so it only ever runs one trial at a time.
+            while not queue.empty():
+                trial_idx = queue.get_nowait()
+                params = sampled[trial_idx]
+                progress = _TrialProgress()
+                on_progress = _progress_callback(pruner, progress) if pruner is not None else None
+                metrics = await run_trial(params, on_progress)
+                if progress.pruned:
+                    self._logger.info("optimization_trial_pruned", trial=trial_idx + 1, n_trials=n_trials)
+                    continue
+                if pruner is not None:
+                    pruner.curves.append(progress.curve)
+                raw = float(getattr(metrics, metric, 0.0))
+                score = self._penalty_score(metrics, params)
+                if direction.lower() == "minimize":
+                    score = -score
+                records[trial_idx] = _TrialRecord(params=params, raw_metric=raw, score=score, metrics=metrics)
+                self._logger.info(
+                    "optimization_trial",
+                    trial=trial_idx + 1,
+                    n_trials=n_trials,
+                    score=score,
+                    metric=raw,
+                )
+
+        if n_jobs > 1 and self._process_data_store is not None:
+            # Worker stores live in a scratch directory that is removed once the pool has shut down.
+            with tempfile.TemporaryDirectory(prefix="optimizer_trials_") as scratch:
+                pool = ProcessPoolExecutor(
+                    max_workers=n_jobs,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_trial_process,
+                    initargs=(self._config, str(self._process_data_store), scratch),
+                )
+                try:
+                    runner = self._pool_runner(pool, strategy_id)
+                    await asyncio.gather(*(_worker(runner) for _ in range(n_jobs)))
+                finally:
+                    # Joining the workers runs their teardown before the scratch stores are deleted.
+                    await asyncio.to_thread(pool.shutdown, cancel_futures=True)
+        else:
+            await _worker(self._engine_runner(strategy_id))
+
+        trials = [trial for trial in records if trial is not None]
+        best: _TrialRecord | None = None
+        for trial in trials:
+            if best is None or trial.score > best.score:
                 best = trial
-            else:
-                if score > best.score:
-                    best = trial
-            self._logger.info(
-                "optimization_trial",
-                trial=trial_idx + 1,
-                n_trials=n_trials,
-                score=score,
-                metric=raw,
-            )
 
         if best is None:
             best = _TrialRecord(params={}, raw_metric=0.0, score=0.0, metrics=BacktestMetrics())
@@ -101,6 +277,36 @@ class StrategyOptimizer:
             verdict=verdict,
         )
 
+    def _pool_runner(self, pool: ProcessPoolExecutor, strategy_id: str) -> _TrialRunner:
+        # Progress callbacks cannot cross the process boundary, so pooled trials are never pruned.
+        async def _in_process(
+            params: dict[str, float],
+            on_progress: Callable[[int, float], bool] | None,
+        ) -> BacktestMetrics:
+            _ = on_progress
+            return await asyncio.get_running_loop().run_in_executor(
+                pool, _run_trial_in_process, strategy_id, params
+            )
+
+        return _in_process
+
+    def _engine_runner(self, strategy_id: str) -> _TrialRunner:
+        async def _on_engine(
+            params: dict[str, float],
+            on_progress: Callable[[int, float], bool] | None,
+        ) -> BacktestMetrics:
+            # Only forward the callback when pruning is on, so engines without it keep working.
+            extra = {"on_progress": on_progress} if on_progress is not None else {}
+            return await self._engine.run_single_strategy(
+                strategy_id=strategy_id,
+                params=params,
+                start=self._config.start_date,
+                end=self._config.end_date,
+                **extra,
+            )
+
+        return _on_engine
+
     def _objective(self, trial: Any, strategy_id: str) -> float:
         """Optuna-compatible objective placeholder."""
 
@@ -6,9 +6,13 @@ import random
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
+import numpy as np
+import polars as pl
+
 from core.audit_journal import AuditJournal
 from core.config_models import IndicatorsConfig, RegimeConfig, RiskConfig, SignalsConfig
 from core.event_bus import EventBus
+from core.jit import njit_or
 from core.logger import get_logger
 from data.asset_types import AssetClass
 from data.models import OHLCVBar
@@ -27,6 +31,8 @@ from risk.position_sizer import PositionSizer
 from risk.risk_manager import RiskManager
 from risk.slippage_model import SlippageModel
 from risk.stop_manager import StopManager
+from signals._kernels import warm_up_kernels as warm_up_strategy_kernels
+from signals.ensemble import warm_up_kernels as warm_up_ensemble_kernels
 from signals.signal_engine import SignalEngine
 from storage.cache_manager import CacheManager
 from storage.data_repository import DataRepository
@@ -41,6 +47,7 @@ async def build_backtest_runtime(
     signals_config: SignalsConfig | None = None,
     risk_config: RiskConfig | None = None,
     indicators_config: IndicatorsConfig | None = None,
+    include_signal_reasons: bool = True,
 ) -> tuple[
     EventBus,
     DataRepository,
@@ -50,7 +57,11 @@ async def build_backtest_runtime(
     RiskManager,
     OrderManager,
 ]:
-    """Build isolated event-driven stack for module 5 backtests."""
+    """Build isolated event-driven stack for module 5 backtests.
+
+    Optimizer runtimes pass ``include_signal_reasons=False``: trials only read metrics, so
+    ensemble reason collection is skipped.
+    """
 
     event_bus = EventBus()
     await event_bus.start()
@@ -94,6 +105,7 @@ async def build_backtest_runtime(
         logger=get_logger("backtest.signal_engine"),
         run_id=run_id,
         audit_journal=AuditJournal(jsonl_path=data_store_path / "audit_backtest_signals.jsonl"),
+        include_reasons=include_signal_reasons,
     )
     await signal_engine.start()
 
@@ -148,6 +160,11 @@ async def build_backtest_runtime(
     )
 
 
+# Bump whenever _synthetic_arrays/_synth_core or the generate_synthetic_frame layout changes, so
+# snapshots cached from an older generator stop being served.
+SYNTHETIC_DATA_VERSION = 1
+
+
 def generate_synthetic_bars(
     *,
     symbol: str,
@@ -161,40 +178,151 @@ def generate_synthetic_bars(
 ) -> list[OHLCVBar]:
     """Generate deterministic synthetic OHLCV bars for demos/tests."""
 
+    stamps, step, opens, highs, lows, closes, volumes = _synthetic_arrays(timeframe, start, end, seed, base_price)
+    if stamps.size == 0:
+        return []
+
+    timestamps = [item.replace(tzinfo=UTC) for item in stamps.tolist()]
+    return [
+        OHLCVBar(
+            symbol=symbol,
+            broker=broker,
+            timeframe=timeframe,
+            timestamp_open=timestamp_open,
+            timestamp_close=timestamp_open + step,
+            open=float(opens[idx]),
+            high=float(highs[idx]),
+            low=float(lows[idx]),
+            close=float(closes[idx]),
+            volume=float(volumes[idx]),
+            spread=0.0001,
+            asset_class=asset_class,
+            source="synthetic",
+        )
+        for idx, timestamp_open in enumerate(timestamps)
+    ]
+
+
+def generate_synthetic_frame(
+    *,
+    symbol: str,
+    broker: str,
+    timeframe: str,
+    start: datetime,
+    end: datetime,
+    seed: int = 42,
+    base_price: float = 1.1000,
+    asset_class: AssetClass = AssetClass.FOREX,
+) -> pl.DataFrame:
+    """Generate the same bars as generate_synthetic_bars as a columnar Polars frame."""
+
+    stamps, step, opens, highs, lows, closes, volumes = _synthetic_arrays(timeframe, start, end, seed, base_price)
+    timestamp_open = pl.Series("timestamp_open", stamps, dtype=pl.Datetime("us")).dt.replace_time_zone("UTC")
+    return pl.DataFrame(
+        {
+            "symbol": symbol,
+            "broker": broker,
+            "timeframe": timeframe,
+            "timestamp_open": timestamp_open,
+            "timestamp_close": timestamp_open + step,
+            "open": opens,
+            "high": highs,
+            "low": lows,
+            "close": closes,
+            "volume": volumes,
+            "spread": np.full(stamps.size, 0.0001),
+            "asset_class": asset_class.value,
+            "source": "synthetic",
+        }
+    )
+
+
+def _synthetic_arrays(
+    timeframe: str,
+    start: datetime,
+    end: datetime,
+    seed: int,
+    base_price: float,
+) -> tuple[np.ndarray, timedelta, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     rng = random.Random(seed)
-    bars: list[OHLCVBar] = []
-    current_time = start.astimezone(UTC)
-    end_utc = end.astimezone(UTC)
-    step_seconds = timeframe_seconds(timeframe)
-    current_price = base_price
-    while current_time < end_utc:
-        drift = 0.00002 if (current_time.hour % 2 == 0) else -0.000015
-        noise = rng.uniform(-0.0002, 0.0002)
-        close = max(current_price + drift + noise, 0.0001)
-        high = max(close, current_price) + abs(rng.uniform(0.0, 0.00015))
-        low = min(close, current_price) - abs(rng.uniform(0.0, 0.00015))
-        volume = 1000.0 + rng.uniform(0.0, 500.0)
-        next_time = current_time + timedelta(seconds=step_seconds)
-        bars.append(
-            OHLCVBar(
-                symbol=symbol,
-                broker=broker,
-                timeframe=timeframe,
-                timestamp_open=current_time,
-                timestamp_close=next_time,
-                open=current_price,
-                high=high,
-                low=low,
-                close=close,
-                volume=volume,
-                spread=0.0001,
-                asset_class=asset_class,
-                source="synthetic",
+    start_utc = start.astimezone(UTC)
+    step = timedelta(seconds=timeframe_seconds(timeframe))
+    count = max(-(-(end.astimezone(UTC) - start_utc) // step), 0)
+
+    offsets = np.arange(count, dtype=np.int64) * int(step.total_seconds())
+    stamps = np.datetime64(start_utc.replace(tzinfo=None), "us") + offsets.astype("timedelta64[s]")
+    hours = stamps.astype("datetime64[h]").astype(np.int64) % 24
+    drifts = np.where(hours % 2 == 0, 0.00002, -0.000015)
+    # Draw in the same per-bar order as the original loop so seeded output stays unchanged.
+    draws = np.array(
+        [
+            (
+                rng.uniform(-0.0002, 0.0002),
+                rng.uniform(0.0, 0.00015),
+                rng.uniform(0.0, 0.00015),
+                rng.uniform(0.0, 500.0),
             )
-        )
+            for _ in range(count)
+        ],
+        dtype=np.float64,
+    ).reshape(count, 4)
+    return (stamps, step, *_synth_core(float(base_price), drifts, draws))
+
+
+def _synth_walk(
+    base_price: float,
+    drifts: np.ndarray,
+    draws: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Run the OHLC random walk over pre-drawn uniforms one bar at a time."""
+
+    n = drifts.shape[0]
+    opens = np.empty(n, dtype=np.float64)
+    highs = np.empty(n, dtype=np.float64)
+    lows = np.empty(n, dtype=np.float64)
+    closes = np.empty(n, dtype=np.float64)
+    volumes = np.empty(n, dtype=np.float64)
+    current_price = base_price
+    for idx in range(n):
+        close = max(current_price + drifts[idx] + draws[idx, 0], 0.0001)
+        opens[idx] = current_price
+        highs[idx] = max(close, current_price) + abs(draws[idx, 1])
+        lows[idx] = min(close, current_price) - abs(draws[idx, 2])
+        closes[idx] = close
+        volumes[idx] = 1000.0 + draws[idx, 3]
         current_price = close
-        current_time = next_time
-    return bars
+    return opens, highs, lows, closes, volumes
+
+
+def _synth_numpy(
+    base_price: float,
+    drifts: np.ndarray,
+    draws: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Accumulating the interleaved (drift, noise) steps adds them in the loop's order, so the
+    # closes match it bit for bit until the 0.0001 floor binds; only then is the loop needed.
+    steps = np.empty(2 * drifts.shape[0] + 1, dtype=np.float64)
+    steps[0] = base_price
+    steps[1::2] = drifts
+    steps[2::2] = draws[:, 0]
+    closes = np.add.accumulate(steps)[2::2]
+    if closes.size and closes.min() < 0.0001:
+        return _synth_walk(base_price, drifts, draws)
+    opens = np.concatenate(([base_price], closes[:-1]))
+    highs = np.maximum(closes, opens) + np.abs(draws[:, 1])
+    lows = np.minimum(closes, opens) - np.abs(draws[:, 2])
+    return opens, highs, lows, closes, 1000.0 + draws[:, 3]
+
+
+_synth_core = njit_or(_synth_numpy)(_synth_walk)
+
+
+def warm_up_kernels() -> None:
+    """Compile JIT kernels on a toy input so the first real run does not pay the compile cost."""
+
+    _synth_core(1.0, np.zeros(2, dtype=np.float64), np.zeros((2, 4), dtype=np.float64))
+    warm_up_ensemble_kernels()
+    warm_up_strategy_kernels()
 
 
 def timeframe_seconds(timeframe: str) -> int:
@@ -213,7 +341,10 @@ def timeframe_seconds(timeframe: str) -> int:
 
 
 __all__ = [
+    "SYNTHETIC_DATA_VERSION",
     "build_backtest_runtime",
     "generate_synthetic_bars",
+    "generate_synthetic_frame",
     "timeframe_seconds",
+    "warm_up_kernels",
 ]
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import sqlite3
+from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Protocol
@@ -42,6 +43,9 @@ class JournalStorage(Protocol):
     async def write(self, entry: JournalEntry) -> None:
         ...
 
+    async def write_many(self, entries: Sequence[JournalEntry]) -> None:
+        ...
+
     async def query(
         self,
         strategy_id: str | None,
@@ -63,6 +67,14 @@ class JSONLStorage:
             await stream.write(entry.model_dump_json())
             await stream.write("\n")
 
+    async def write_many(self, entries: Sequence[JournalEntry]) -> None:
+        if not entries:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        payload = "".join(f"{entry.model_dump_json()}\n" for entry in entries)
+        async with aiofiles.open(self._path, mode="a", encoding="utf-8") as stream:
+            await stream.write(payload)
+
     async def query(
         self,
         strategy_id: str | None,
@@ -94,7 +106,11 @@ class SQLiteStorage:
         self._initialize_schema()
 
     async def write(self, entry: JournalEntry) -> None:
-        await asyncio.to_thread(self._write_sync, entry)
+        await asyncio.to_thread(self._write_sync, [entry])
+
+    async def write_many(self, entries: Sequence[JournalEntry]) -> None:
+        if entries:
+            await asyncio.to_thread(self._write_sync, entries)
 
     async def query(
         self,
@@ -129,10 +145,10 @@ class SQLiteStorage:
             )
             conn.commit()
 
-    def _write_sync(self, entry: JournalEntry) -> None:
-        payload = _entry_to_sql_row(entry)
+    def _write_sync(self, entries: Sequence[JournalEntry]) -> None:
+        payload = [_entry_to_sql_row(entry) for entry in entries]
         with sqlite3.connect(self._path) as conn:
-            conn.execute(
+            conn.executemany(
                 """
                 INSERT OR REPLACE INTO journal (
                     entry_id, timestamp, run_id, strategy_id, strategy_version, symbol,
@@ -222,6 +238,14 @@ class AuditJournal:
             tasks.append(self._sqlite_storage.write(entry))
         await asyncio.gather(*tasks)
 
+    async def write_many(self, entries: Sequence[JournalEntry]) -> None:
+        """Write a batch of journal entries with one append per storage backend."""
+
+        tasks = [self._jsonl_storage.write_many(entries)]
+        if self._sqlite_storage is not None:
+            tasks.append(self._sqlite_storage.write_many(entries))
+        await asyncio.gather(*tasks)
+
     async def query(
         self,
         strategy_id: str | None = None,
@@ -0,0 +1,31 @@
+"""Optional numba JIT shared by the numeric kernels.
+
+numba ships in the ``jit`` extra. Without it each kernel uses its vectorized numpy fallback
+instead of running the loop it was written for in plain Python.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, TypeVar, cast
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional JIT backend
+    numba = None  # type: ignore[assignment]
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def njit_or(fallback: _F) -> Callable[[_F], _F]:
+    """Compile the decorated loop with ``numba.njit`` when installed, else use ``fallback``."""
+
+    def decorate(func: _F) -> _F:
+        if numba is None:
+            return fallback
+        return cast(_F, numba.njit(cache=True, nogil=True)(func))
+
+    return decorate
+
+
+__all__ = ["njit_or"]
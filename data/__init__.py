@@ -1,6 +1,7 @@
 """Data layer package exports."""
 
 from data.asset_types import AssetClass, AssetMarket, TradingHorizon
+from data.bar_series import BarSeries
 from data.feed_manager import FeedManager
 from data.models import AssetInfo, ConnectorStatus, DataQualityReport, OHLCVBar, OrderBook, Tick
 
@@ -9,6 +10,7 @@ __all__ = [
     "AssetMarket",
     "TradingHorizon",
     "OHLCVBar",
+    "BarSeries",
     "Tick",
     "OrderBook",
     "AssetInfo",
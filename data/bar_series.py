@@ -0,0 +1,141 @@
+"""Column-wise NumPy view over a window of OHLCV bars."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+from data.models import OHLCVBar
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+_Extractor = Callable[[Sequence[OHLCVBar], str], np.ndarray]
+
+
+class BarSeries:
+    """Structure-of-arrays view of a bar window.
+
+    Columns are extracted lazily on first access and cached on the instance, so
+    one fetched window is traversed at most once per field however many
+    consumers it is handed to. Columns are read-only because they are shared.
+    """
+
+    __slots__ = ("_bars", "_columns", "_length", "_parent", "_start")
+
+    def __init__(self, bars: Sequence[OHLCVBar]) -> None:
+        self._bars = bars
+        self._columns: dict[str, np.ndarray] = {}
+        self._length = len(bars)
+        self._parent: BarSeries | None = None
+        self._start = 0
+
+    def window(self, start: int, stop: int) -> BarSeries:
+        """View of ``bars[start:stop]`` whose columns are slices of this series' columns.
+
+        A long history is then traversed once per field, however many windows are cut from it.
+        """
+
+        view = BarSeries(self._bars[start:stop])
+        view._parent = self
+        view._start = start
+        return view
+
+    def rolled(self, bar: OHLCVBar, maxlen: int) -> BarSeries:
+        """Series over the last ``maxlen`` bars once ``bar`` is appended to this window.
+
+        Columns already extracted here are carried over and extended by one value, so a window
+        that advances bar by bar never re-reads the bars it already holds.
+        """
+
+        start = max(len(self._bars) - maxlen + 1, 0)
+        rolled = BarSeries([*self._bars[start:], bar])
+        for field, column in self._columns.items():
+            value = _EXTRACTORS.get(field, _extract_floats)((bar,), field)
+            extended = np.concatenate((column[start:], value))
+            extended.setflags(write=False)
+            rolled._columns[field] = extended
+        return rolled
+
+    def __len__(self) -> int:
+        return len(self._bars)
+
+    @property
+    def bars(self) -> Sequence[OHLCVBar]:
+        return self._bars
+
+    @property
+    def closes(self) -> np.ndarray:
+        return self._column("close")
+
+    @property
+    def highs(self) -> np.ndarray:
+        return self._column("high")
+
+    @property
+    def lows(self) -> np.ndarray:
+        return self._column("low")
+
+    @property
+    def volumes(self) -> np.ndarray:
+        return self._column("volume")
+
+    @property
+    def spreads(self) -> np.ndarray:
+        """Spread column with NaN where the bar carries no spread."""
+
+        return self._column("spread")
+
+    @property
+    def timestamps_ns(self) -> np.ndarray:
+        """Bar close timestamps as int64 nanoseconds since the epoch."""
+
+        return self._column("timestamp_close")
+
+    def average_spread(self, window: int) -> float | None:
+        """Mean of the positive spreads among the last ``window`` bars."""
+
+        tail = self.spreads[-window:]
+        positive = tail[tail > 0]
+        return float(positive.mean()) if positive.size else None
+
+    def _column(self, field: str) -> np.ndarray:
+        column = self._columns.get(field)
+        if column is None:
+            parent = self._parent
+            if parent is None:
+                column = _EXTRACTORS.get(field, _extract_floats)(self._bars, field)
+                column.setflags(write=False)
+            else:
+                column = parent._column(field)[self._start : self._start + self._length]
+            self._columns[field] = column
+        return column
+
+
+def _extract_floats(bars: Sequence[OHLCVBar], field: str) -> np.ndarray:
+    return np.fromiter((getattr(bar, field) for bar in bars), dtype=np.float64, count=len(bars))
+
+
+def _extract_spreads(bars: Sequence[OHLCVBar], field: str) -> np.ndarray:
+    return np.fromiter(
+        (np.nan if bar.spread is None else bar.spread for bar in bars),
+        dtype=np.float64,
+        count=len(bars),
+    )
+
+
+def _extract_timestamps_ns(bars: Sequence[OHLCVBar], field: str) -> np.ndarray:
+    return np.fromiter(
+        ((getattr(bar, field) - _EPOCH) // _MICROSECOND * 1_000 for bar in bars),
+        dtype=np.int64,
+        count=len(bars),
+    )
+
+
+# Columns not listed here are plain float fields.
+_EXTRACTORS: dict[str, _Extractor] = {
+    "spread": _extract_spreads,
+    "timestamp_close": _extract_timestamps_ns,
+}
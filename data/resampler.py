@@ -6,6 +6,18 @@ from datetime import UTC, datetime, timedelta
 
 from data.models import OHLCVBar, Tick
 
+TIMEFRAME_SECONDS: dict[str, int] = {
+    "M1": 60,
+    "M5": 300,
+    "M15": 900,
+    "M30": 1800,
+    "H1": 3600,
+    "H4": 14400,
+    "D1": 86400,
+    "W1": 604800,
+    "MN1": 2592000,
+}
+
 
 class Resampler:
     """Resample ticks/bars between supported timeframes."""
@@ -126,21 +138,10 @@ class Resampler:
     def get_timeframe_seconds(self, timeframe: str) -> int:
         """Return timeframe duration in seconds."""
 
-        mapping = {
-            "M1": 60,
-            "M5": 300,
-            "M15": 900,
-            "M30": 1800,
-            "H1": 3600,
-            "H4": 14400,
-            "D1": 86400,
-            "W1": 604800,
-            "MN1": 2592000,
-        }
-        tf = timeframe.upper()
-        if tf not in mapping:
+        seconds = TIMEFRAME_SECONDS.get(timeframe.upper())
+        if seconds is None:
             raise ValueError(f"Unsupported timeframe: {timeframe}")
-        return mapping[tf]
+        return seconds
 
     def is_bar_complete(self, bar_open_time: datetime, timeframe: str) -> bool:
         """Return True if the bar close time has passed in UTC."""